@@ -5,12 +5,42 @@ Wraps requests.Session with configurable base URL, timeouts, and retry mechanism
 Follows Single Responsibility Principle - handles only HTTP communication.
 """
 
+import os
+import ssl
+import time
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from utils.logger import get_logger
 
+# Prefer orjson's C encoder; fall back to stdlib json where the wheel
+# isn't available (same pattern as response_handler's decoder)
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+
+    def _json_dumps(payload: Any) -> bytes:
+        return json.dumps(payload).encode('utf-8')
+
+
+class _SharedSSLContextAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that reuses one pre-built SSLContext for every connection.
+
+    urllib3 otherwise constructs a fresh context (re-parsing the CA
+    bundle) each time the pool opens a new connection; sharing one
+    context makes that a one-time cost for the whole process.
+    """
+
+    _shared_ctx = ssl.create_default_context()
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self._shared_ctx
+        super().init_poolmanager(*args, **kwargs)
+
 
 class APIClient:
     """
@@ -27,7 +57,10 @@ class APIClient:
                     base_url: str,
                     timeout: int = 10,
                     max_retries: int = 3,
-                    backoff_factor: float = 0.3
+                    backoff_factor: float = 0.3,
+                    pool_connections: int = 20,
+                    pool_maxsize: int = 20,
+                    pool_block: bool = False
                 ):
         """
             Initialize API client.
@@ -37,76 +70,286 @@ class APIClient:
                 timeout: Request timeout in seconds
                 max_retries: Maximum number of retry attempts
                 backoff_factor: Backoff factor for retries
+                pool_connections: Number of urllib3 connection pools to cache
+                pool_maxsize: Maximum keep-alive connections per pool
+                pool_block: Whether to block when the pool is exhausted
         """
         self.base_url = base_url.rstrip('/')
+        self._base_with_slash = self.base_url + '/'
         self.timeout = timeout
         self.logger = get_logger(__name__)
 
-        # Create session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"]
+        # ETag cache for GET requests: (url, sorted params) -> (etag, body, status)
+        self._response_cache: Dict[Tuple, Tuple[str, bytes, int]] = {}
+
+        # Parsed-JSON memo for get_cached: (endpoint, sorted params) -> JSON data
+        self._json_cache: Dict[Tuple, Any] = {}
+
+        # Create session with retry strategy. When API_CACHE_DIR is set,
+        # GET responses are persisted to disk so repeat runs (and
+        # pytest --lf reruns) skip the network entirely.
+        cache_dir = os.environ.get("API_CACHE_DIR")
+        self._disk_cache_enabled = bool(cache_dir)
+        if cache_dir:
+            import requests_cache
+            self.session = requests_cache.CachedSession(
+                cache_name=os.path.join(cache_dir, "api_cache"),
+                backend="filesystem",
+                allowable_methods=("GET",),
+                expire_after=3600
+            )
+            self.logger.info(f"Filesystem response cache enabled at: {cache_dir}")
+        else:
+            self.session = requests.Session()
+        # Default headers set once on the session instead of per request
+        self.session.headers.update({
+            "User-Agent": "api-test-framework/1.0",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate"
+        })
+
+        retry_strategy = self._build_retry(max_retries, backoff_factor)
+        adapter = _SharedSSLContextAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
         self.logger.info(f"APIClient initialized with base_url: {self.base_url}")
 
+    @staticmethod
+    def _build_retry(max_retries: int, backoff_factor: float) -> Retry:
+        """
+        Build the retry policy for the session adapter.
+
+        Pass max_retries=0 for fast-fail clients (e.g. negative tests)
+        where backoff on transient server errors would only amplify
+        latency.
+
+        Args:
+            max_retries: Maximum number of retry attempts
+            backoff_factor: Backoff factor for retries
+
+        Returns:
+            Configured Retry instance
+        """
+        return Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"],
+            raise_on_status=False,
+            respect_retry_after_header=True
+        )
+
+    @staticmethod
+    def _params_key(params: Optional[Dict[str, Any]]) -> Optional[Tuple]:
+        """
+        Build a hashable cache-key fragment from query parameters.
+
+        List values (requests' repeated-key syntax, e.g.
+        params={"id": [1, 2]}) are converted to tuples. Returns None
+        when the params can't be made hashable, signalling callers to
+        skip caching for that request.
+
+        Args:
+            params: Query parameters
+
+        Returns:
+            Hashable tuple of sorted items, or None
+        """
+        try:
+            key = tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in sorted((params or {}).items())
+            )
+            hash(key)
+            return key
+        except TypeError:
+            return None
+
     def _build_url(self, endpoint: str) -> str:
-        """Build full URL from endpoint."""
-        endpoint = endpoint.lstrip('/')
-        return f"{self.base_url}/{endpoint}"
+        """
+        Build full URL from endpoint.
+
+        Absolute URLs are passed through untouched; relative endpoints
+        are joined with a single concatenation against the precomputed
+        base.
+        """
+        if endpoint.startswith(('http://', 'https://')):
+            return endpoint
+        if endpoint.startswith('/'):
+            return self.base_url + endpoint
+        return self._base_with_slash + endpoint
 
     def _log_request(self, method: str, url: str, **kwargs) -> None:
-        """Log request details (without sensitive data)."""
-        params = kwargs.get('params', {})
-        self.logger.debug(f"Request: {method} {url} | Params: {params}")
+        """
+        Log request details (without sensitive data).
 
-    def _log_response(self, response: requests.Response) -> None:
-        """Log response details."""
+        Uses loguru's deferred {}-formatting so the message string is
+        only built when a sink actually records DEBUG.
+        """
+        self.logger.debug("Request: {} {} | Params: {}", method, url, kwargs.get('params', {}))
+
+    def _log_response(self, response: requests.Response, elapsed_ms: float) -> None:
+        """
+        Log response details.
+
+        Takes the elapsed time measured with a monotonic clock by the
+        caller, avoiding requests' timedelta-based response.elapsed.
+        """
         self.logger.debug(
-            f"Response: {response.status_code} | "
-            f"URL: {response.url} | "
-            f"Time: {response.elapsed.total_seconds():.2f}s"
+            "Response: {} | URL: {} | Time: {:.2f}ms",
+            response.status_code,
+            response.url,
+            elapsed_ms
         )
 
+    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the session with shared URL building,
+        timing, and logging.
+
+        All public verb methods funnel through here, so instrumentation
+        and caching hooks live in one place.
+
+        Args:
+            method: HTTP method name
+            endpoint: API endpoint path or absolute URL
+            **kwargs: Arguments forwarded to requests.Session.request
+
+        Returns:
+            Response object
+        """
+        url = self._build_url(endpoint)
+        self._log_request(method, url, params=kwargs.get('params'))
+
+        t0 = time.perf_counter_ns()
+        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        self._log_response(response, (time.perf_counter_ns() - t0) / 1e6)
+
+        # Any mutation may change what idempotent reads would return,
+        # so drop the GET-side caches wholesale
+        if method != "GET" and (self._response_cache or self._json_cache):
+            self._response_cache.clear()
+            self._json_cache.clear()
+            self.logger.debug("GET caches invalidated after {} request", method)
+
+        return response
+
     def get(
                 self,
                 endpoint: str,
                 params: Optional[Dict[str, Any]] = None,
                 headers: Optional[Dict[str, str]] = None,
+                cache: bool = True,
                 **kwargs
             ) -> requests.Response:
         """
         Perform GET request.
 
+        When caching is enabled and the server returned an ETag for a
+        previous identical request, the request is sent conditionally
+        (If-None-Match) and a 304 reply is answered from the cached body
+        without re-downloading it. Streaming requests (stream=True)
+        bypass both the ETag cache and the filesystem cache entirely:
+        persisting a body would drain response.raw before the caller
+        could read it.
+
         Args:
             endpoint: API endpoint path
             params: Query parameters
             headers: HTTP headers
+            cache: Use the ETag cache for this request
             **kwargs: Additional requests arguments
 
         Returns:
             Response object
         """
         url = self._build_url(endpoint)
-        self._log_request("GET", url, params=params)
-
-        response = self.session.get(
-            url,
-            params=params,
-            headers=headers,
-            timeout=self.timeout,
-            **kwargs
-        )
 
-        self._log_response(response)
+        cached = None
+        cache_key = None
+        if cache and not kwargs.get('stream'):
+            params_key = self._params_key(params)
+            if params_key is not None:
+                cache_key = (url, params_key)
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    headers = {**(headers or {}), 'If-None-Match': cached[0]}
+
+        if kwargs.get('stream') and self._disk_cache_enabled:
+            # CachedSession eagerly reads the body to persist it, which
+            # breaks raw-stream consumers; send streaming GETs uncached
+            with self.session.cache_disabled():
+                return self._request("GET", url, params=params, headers=headers, **kwargs)
+
+        response = self._request("GET", url, params=params, headers=headers, **kwargs)
+
+        if cache_key is not None:
+            if response.status_code == 304 and cached is not None:
+                self.logger.debug("ETag cache hit (304 Not Modified): {}", url)
+                return self._rebuild_cached_response(response, cached)
+            etag = response.headers.get('ETag')
+            if response.status_code == 200 and etag:
+                self._response_cache[cache_key] = (etag, response.content, response.status_code)
+
         return response
 
+    def get_cached(
+                    self,
+                    endpoint: str,
+                    params: Optional[Dict[str, Any]] = None
+                ) -> Any:
+        """
+        Perform GET request and memoize the parsed JSON.
+
+        Intended for idempotent reads repeated across tests (e.g.
+        GET /posts); the first call hits the network, subsequent calls
+        with the same endpoint and params return the cached JSON
+        without any I/O. Use get() for negative or mutating scenarios.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Parsed JSON data (dict or list)
+        """
+        params_key = self._params_key(params)
+        if params_key is None:
+            self.logger.debug("Params not hashable; bypassing JSON cache: GET {}", endpoint)
+            return self.get(endpoint, params=params).json()
+
+        key = (endpoint, params_key)
+        if key in self._json_cache:
+            self.logger.debug("JSON cache hit: GET {} | Params: {}", endpoint, params)
+            return self._json_cache[key]
+
+        response = self.get(endpoint, params=params)
+        json_data = response.json()
+        self._json_cache[key] = json_data
+        return json_data
+
+    def _rebuild_cached_response(
+                                    self,
+                                    response: requests.Response,
+                                    cached: Tuple[str, bytes, int]
+                                ) -> requests.Response:
+        """Build a Response carrying the cached body for a 304 reply."""
+        _, body, status = cached
+        cached_response = requests.Response()
+        cached_response.status_code = status
+        cached_response._content = body
+        cached_response.headers = response.headers
+        cached_response.url = response.url
+        cached_response.request = response.request
+        cached_response.elapsed = response.elapsed
+        return cached_response
+
     def post(
                 self,
                 endpoint: str,
@@ -128,20 +371,25 @@ class APIClient:
         Returns:
             Response object
         """
-        url = self._build_url(endpoint)
-        self._log_request("POST", url)
-
-        response = self.session.post(
-            url,
-            json=json,
-            data=data,
-            headers=headers,
-            timeout=self.timeout,
-            **kwargs
-        )
+        return self._request("POST", endpoint, json=json, data=data, headers=headers, **kwargs)
 
-        self._log_response(response)
-        return response
+    def post_json(self, endpoint: str, payload: Dict[str, Any]) -> requests.Response:
+        """
+        Perform POST request with a pre-encoded JSON body.
+
+        Encoding once (orjson when available) and sending the bytes via
+        data= skips requests' per-call json.dumps, and retries resend
+        the already-encoded buffer without re-serializing.
+
+        Args:
+            endpoint: API endpoint path
+            payload: JSON-serializable payload
+
+        Returns:
+            Response object
+        """
+        body = _json_dumps(payload)
+        return self.post(endpoint, data=body, headers={'Content-Type': 'application/json'})
 
     def put(
                 self,
@@ -164,20 +412,21 @@ class APIClient:
         Returns:
             Response object
         """
-        url = self._build_url(endpoint)
-        self._log_request("PUT", url)
-
-        response = self.session.put(
-            url,
-            json=json,
-            data=data,
-            headers=headers,
-            timeout=self.timeout,
-            **kwargs
-        )
+        return self._request("PUT", endpoint, json=json, data=data, headers=headers, **kwargs)
 
-        self._log_response(response)
-        return response
+    def put_json(self, endpoint: str, payload: Dict[str, Any]) -> requests.Response:
+        """
+        Perform PUT request with a pre-encoded JSON body.
+
+        Args:
+            endpoint: API endpoint path
+            payload: JSON-serializable payload
+
+        Returns:
+            Response object
+        """
+        body = _json_dumps(payload)
+        return self.put(endpoint, data=body, headers={'Content-Type': 'application/json'})
 
     def delete(
                 self,
@@ -196,18 +445,7 @@ class APIClient:
         Returns:
             Response object
         """
-        url = self._build_url(endpoint)
-        self._log_request("DELETE", url)
-
-        response = self.session.delete(
-            url,
-            headers=headers,
-            timeout=self.timeout,
-            **kwargs
-        )
-
-        self._log_response(response)
-        return response
+        return self._request("DELETE", endpoint, headers=headers, **kwargs)
 
     def close(self) -> None:
         """Close the session."""
@@ -0,0 +1,177 @@
+"""
+Async API Client module.
+
+Wraps httpx.AsyncClient with configurable base URL, timeouts, and connection limits.
+Complements the synchronous APIClient for tests that fan out multiple
+requests concurrently via asyncio.gather.
+"""
+
+import asyncio
+import httpx
+from typing import List, Optional, Dict, Any
+from utils.logger import get_logger
+
+
+class AsyncAPIClient:
+    """
+    Async HTTP client wrapper for making concurrent API requests.
+
+    Features:
+    - Configurable base URL and timeout
+    - Shared connection pool with keep-alive reuse
+    - Request/response logging
+    """
+
+    def __init__(
+                    self,
+                    base_url: str,
+                    timeout: int = 10,
+                    max_connections: int = 50,
+                    max_keepalive_connections: int = 50
+                ):
+        """
+            Initialize async API client.
+
+            Args:
+                base_url: Base URL for API requests
+                timeout: Request timeout in seconds
+                max_connections: Maximum concurrent connections in the pool
+                max_keepalive_connections: Maximum keep-alive connections to retain
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.logger = get_logger(__name__)
+
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            )
+        )
+
+        self.logger.info(f"AsyncAPIClient initialized with base_url: {self.base_url}")
+
+    async def get(
+                    self,
+                    endpoint: str,
+                    params: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None,
+                    **kwargs
+                ) -> httpx.Response:
+        """
+        Perform async GET request.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            headers: HTTP headers
+            **kwargs: Additional httpx arguments
+
+        Returns:
+            Response object
+        """
+        self.logger.debug(f"Async request: GET {endpoint} | Params: {params}")
+        response = await self.client.get(endpoint, params=params, headers=headers, **kwargs)
+        self.logger.debug(f"Async response: {response.status_code} | URL: {response.url}")
+        return response
+
+    async def get_many(
+                        self,
+                        endpoints: List[str],
+                        params: Optional[Dict[str, Any]] = None
+                    ) -> List[httpx.Response]:
+        """
+        Perform GET requests for several endpoints concurrently.
+
+        All requests are issued through asyncio.gather over the shared
+        connection pool, so total wall time is roughly one round-trip
+        instead of one per endpoint (e.g. fanning out over /posts/{id}).
+
+        Args:
+            endpoints: API endpoint paths to fetch
+            params: Query parameters applied to every request
+
+        Returns:
+            Responses in the same order as the endpoints
+        """
+        self.logger.info(f"Fanning out {len(endpoints)} concurrent GET requests")
+        return await asyncio.gather(
+            *[self.get(endpoint, params=params) for endpoint in endpoints]
+        )
+
+    async def post(
+                    self,
+                    endpoint: str,
+                    json: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None,
+                    **kwargs
+                ) -> httpx.Response:
+        """
+        Perform async POST request.
+
+        Args:
+            endpoint: API endpoint path
+            json: JSON payload
+            headers: HTTP headers
+            **kwargs: Additional httpx arguments
+
+        Returns:
+            Response object
+        """
+        self.logger.debug(f"Async request: POST {endpoint}")
+        response = await self.client.post(endpoint, json=json, headers=headers, **kwargs)
+        self.logger.debug(f"Async response: {response.status_code} | URL: {response.url}")
+        return response
+
+    async def put(
+                    self,
+                    endpoint: str,
+                    json: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None,
+                    **kwargs
+                ) -> httpx.Response:
+        """
+        Perform async PUT request.
+
+        Args:
+            endpoint: API endpoint path
+            json: JSON payload
+            headers: HTTP headers
+            **kwargs: Additional httpx arguments
+
+        Returns:
+            Response object
+        """
+        self.logger.debug(f"Async request: PUT {endpoint}")
+        response = await self.client.put(endpoint, json=json, headers=headers, **kwargs)
+        self.logger.debug(f"Async response: {response.status_code} | URL: {response.url}")
+        return response
+
+    async def delete(
+                    self,
+                    endpoint: str,
+                    headers: Optional[Dict[str, str]] = None,
+                    **kwargs
+                ) -> httpx.Response:
+        """
+        Perform async DELETE request.
+
+        Args:
+            endpoint: API endpoint path
+            headers: HTTP headers
+            **kwargs: Additional httpx arguments
+
+        Returns:
+            Response object
+        """
+        self.logger.debug(f"Async request: DELETE {endpoint}")
+        response = await self.client.delete(endpoint, headers=headers, **kwargs)
+        self.logger.debug(f"Async response: {response.status_code} | URL: {response.url}")
+        return response
+
+    async def aclose(self) -> None:
+        """Close the underlying client."""
+        await self.client.aclose()
+        self.logger.info("AsyncAPIClient closed")
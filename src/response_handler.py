@@ -5,24 +5,62 @@ Responsible for all response validation and parsing logic.
 Provides reusable methods for status validation, JSON parsing, and schema validation.
 """
 
+import fastjsonschema
+import ijson
 import requests
-from typing import Any, Dict, List, Union
-from jsonschema import validate, ValidationError
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+from jsonschema import Draft7Validator, ValidationError
 from utils.logger import get_logger
 
+# Prefer orjson's C parser; fall back to stdlib json where the wheel
+# isn't available
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+# Prefer the Rust-compiled validator when its wheel is available;
+# fall back to the pure-Python jsonschema engine otherwise
+try:
+    import jsonschema_rs
+except ImportError:
+    jsonschema_rs = None
+
+_SCHEMA_ERRORS = (
+    (ValidationError, jsonschema_rs.ValidationError)
+    if jsonschema_rs is not None
+    else (ValidationError,)
+)
+
+# Module-level logger so the hot assertion helpers skip per-call
+# self attribute resolution
+_LOG = get_logger(__name__)
+
+# Sentinel distinguishing "key absent" from "value is None" in one dict probe
+_MISSING = object()
+
 
 class ResponseHandler:
     """
     Handler for API response validation and parsing.
 
     Follows Single Responsibility Principle - handles only response processing.
+    Assertion helpers are stateless staticmethods; only validate_schema
+    keeps per-instance state (its compiled-validator cache).
     """
 
     def __init__(self):
         """Initialize response handler."""
-        self.logger = get_logger(__name__)
+        # id(schema) -> (schema, compiled validator); the schema
+        # reference keeps the id stable for the cache's lifetime
+        self._validator_cache: Dict[int, Tuple[Any, Any]] = {}
 
-    def assert_status(self, response: requests.Response, expected_status: int) -> None:
+    @staticmethod
+    def assert_status(response: requests.Response, expected_status: int) -> None:
         """
         Assert response status code matches expected value.
 
@@ -38,12 +76,17 @@ class ResponseHandler:
             f"Expected status {expected_status}, but got {actual_status}. "
             f"Response: {response.text}"
         )
-        self.logger.info(f"Status code validation passed: {expected_status}")
+        _LOG.info("Status code validation passed: {}", expected_status)
 
-    def get_json(self, response: requests.Response) -> Union[Dict[str, Any], List[Any]]:
+    @staticmethod
+    def get_json(response: requests.Response) -> Union[Dict[str, Any], List[Any]]:
         """
         Parse response JSON with error handling.
 
+        Parses the raw bytes directly (orjson when available, stdlib
+        json otherwise) instead of response.json(), skipping charset
+        inference (JSON is UTF-8 per RFC 8259).
+
         Args:
             response: Response object
 
@@ -54,17 +97,60 @@ class ResponseHandler:
             ValueError: If response is not valid JSON
         """
         try:
-            json_data = response.json()
-            self.logger.debug(f"Successfully parsed JSON response")
+            json_data = _json_loads(response.content)
+            _LOG.debug("Successfully parsed JSON response")
             return json_data
-        except requests.exceptions.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse JSON: {e}")
+        except _JSONDecodeError as e:
+            _LOG.error("Failed to parse JSON: {}", e)
             raise ValueError(f"Response is not valid JSON: {response.text}") from e
 
+    @staticmethod
+    def iter_json_array(response: requests.Response) -> Iterator[Any]:
+        """
+        Lazily iterate the items of a streamed JSON array response.
+
+        The response must have been requested with stream=True; items
+        are parsed incrementally with ijson while bytes are still
+        arriving, so consumers can validate or count posts without
+        materializing the whole list.
+
+        Args:
+            response: Streaming response whose body is a JSON array
+
+        Returns:
+            Iterator over the parsed array items
+        """
+        response.raw.decode_content = True
+        return ijson.items(response.raw, 'item')
+
+    @staticmethod
+    def compile_schema(schema: Dict[str, Any]) -> Any:
+        """
+        Compile a schema with the fastest available engine.
+
+        Returns a jsonschema_rs.JSONSchema when the Rust wheel is
+        installed, otherwise a jsonschema.Draft7Validator. Both expose
+        validate(instance).
+
+        Args:
+            schema: JSON schema definition
+
+        Returns:
+            Compiled validator object
+        """
+        if jsonschema_rs is not None:
+            return jsonschema_rs.JSONSchema(schema)
+        return Draft7Validator(schema)
+
     def validate_schema(self, json_data: Union[Dict, List], schema: Dict[str, Any]) -> None:
         """
         Validate JSON data against schema.
 
+        The compiled validator is cached per schema object, so repeated
+        validations (e.g. one per post in a list) skip re-compiling the
+        schema each call. Validation runs in the Rust engine when
+        jsonschema-rs is installed.
+
         Args:
             json_data: JSON data to validate
             schema: JSON schema definition
@@ -72,14 +158,46 @@ class ResponseHandler:
         Raises:
             ValidationError: If validation fails
         """
+        entry = self._validator_cache.get(id(schema))
+        if entry is None or entry[0] is not schema:
+            entry = (schema, self.compile_schema(schema))
+            self._validator_cache[id(schema)] = entry
+        validator = entry[1]
         try:
-            validate(instance=json_data, schema=schema)
-            self.logger.info("Schema validation passed")
-        except ValidationError as e:
-            self.logger.error(f"Schema validation failed: {e.message}")
+            validator.validate(json_data)
+            _LOG.info("Schema validation passed")
+        except _SCHEMA_ERRORS as e:
+            _LOG.error("Schema validation failed: {}", e)
             raise
 
-    def assert_field_exists(self, json_data: Dict[str, Any], field_name: str) -> None:
+    @staticmethod
+    def validate_schema_fast(
+                                json_data: Union[Dict, List],
+                                compiled_fn: Callable[[Any], Any]
+                            ) -> None:
+        """
+        Validate JSON data using a pre-compiled fastjsonschema validator.
+
+        fastjsonschema generates a plain Python function specialized to
+        the schema, so repeated validation avoids walking the schema
+        dict on every call. Compile once with fastjsonschema.compile().
+
+        Args:
+            json_data: JSON data to validate
+            compiled_fn: Callable returned by fastjsonschema.compile()
+
+        Raises:
+            fastjsonschema.JsonSchemaException: If validation fails
+        """
+        try:
+            compiled_fn(json_data)
+            _LOG.info("Schema validation passed")
+        except fastjsonschema.JsonSchemaException as e:
+            _LOG.error("Schema validation failed: {}", e.message)
+            raise
+
+    @staticmethod
+    def assert_field_exists(json_data: Dict[str, Any], field_name: str) -> None:
         """
         Assert that a field exists in JSON data.
 
@@ -91,10 +209,10 @@ class ResponseHandler:
             AssertionError: If field doesn't exist
         """
         assert field_name in json_data, f"Field '{field_name}' not found in response"
-        self.logger.debug(f"Field '{field_name}' exists in response")
+        _LOG.debug("Field '{}' exists in response", field_name)
 
+    @staticmethod
     def assert_field_value(
-                            self,
                             json_data: Dict[str, Any],
                             field_name: str,
                             expected_value: Any
@@ -110,16 +228,39 @@ class ResponseHandler:
         Raises:
             AssertionError: If value doesn't match
         """
-        self.assert_field_exists(json_data, field_name)
-        actual_value = json_data[field_name]
+        actual_value = json_data.get(field_name, _MISSING)
+        assert actual_value is not _MISSING, f"Field '{field_name}' not found in response"
         assert actual_value == expected_value, (
             f"Field '{field_name}': expected '{expected_value}', "
             f"but got '{actual_value}'"
         )
-        self.logger.info(f"Field '{field_name}' has expected value: {expected_value}")
+        _LOG.info("Field '{}' has expected value: {}", field_name, expected_value)
+
+    @staticmethod
+    def assert_fields_match(json_data: Dict[str, Any], expected: Dict[str, Any]) -> None:
+        """
+        Assert that several fields match expected values in one comparison.
+
+        Builds the subset of json_data for the expected keys and compares
+        it with a single dict equality, replacing a chain of
+        assert_field_value calls.
+
+        Args:
+            json_data: JSON data dictionary
+            expected: Mapping of field name to expected value
+
+        Raises:
+            AssertionError: If any field is missing or differs
+        """
+        subset = {key: json_data.get(key, _MISSING) for key in expected}
+        assert subset == expected, (
+            f"Fields mismatch. Expected: {expected}, but got: "
+            f"{ {k: ('<missing>' if v is _MISSING else v) for k, v in subset.items()} }"
+        )
+        _LOG.info("Fields have expected values: {}", list(expected))
 
+    @staticmethod
     def assert_field_type(
-                            self,
                             json_data: Dict[str, Any],
                             field_name: str,
                             expected_type: type
@@ -135,15 +276,16 @@ class ResponseHandler:
         Raises:
             AssertionError: If type doesn't match
         """
-        self.assert_field_exists(json_data, field_name)
-        actual_value = json_data[field_name]
+        actual_value = json_data.get(field_name, _MISSING)
+        assert actual_value is not _MISSING, f"Field '{field_name}' not found in response"
         assert isinstance(actual_value, expected_type), (
             f"Field '{field_name}': expected type {expected_type.__name__}, "
             f"but got {type(actual_value).__name__}"
         )
-        self.logger.debug(f"Field '{field_name}' has expected type: {expected_type.__name__}")
+        _LOG.debug("Field '{}' has expected type: {}", field_name, expected_type.__name__)
 
-    def assert_non_empty_list(self, json_data: List[Any]) -> None:
+    @staticmethod
+    def assert_non_empty_list(json_data: List[Any]) -> None:
         """
         Assert that response is a non-empty list.
 
@@ -155,9 +297,10 @@ class ResponseHandler:
         """
         assert isinstance(json_data, list), f"Expected list, but got {type(json_data).__name__}"
         assert len(json_data) > 0, "Expected non-empty list, but got empty list"
-        self.logger.info(f"Response is a non-empty list with {len(json_data)} items")
+        _LOG.info("Response is a non-empty list with {} items", len(json_data))
 
-    def assert_list_length(self, json_data: List[Any], expected_length: int) -> None:
+    @staticmethod
+    def assert_list_length(json_data: List[Any], expected_length: int) -> None:
         """
         Assert that list has expected length.
 
@@ -173,6 +316,9 @@ class ResponseHandler:
         assert actual_length == expected_length, (
             f"Expected list length {expected_length}, but got {actual_length}"
         )
-        self.logger.info(f"List has expected length: {expected_length}")
+        _LOG.info("List has expected length: {}", expected_length)
 
 
+# Shared default instance; the helpers are stateless apart from the
+# validator cache, so one handler can serve the whole process
+default_handler = ResponseHandler()
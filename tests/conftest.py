@@ -4,12 +4,17 @@ Pytest fixtures and configuration.
 Provides shared fixtures for API client, base URL, logger, and schema.
 """
 
+import fastjsonschema
 import json
+import os
 import pytest
+import pytest_asyncio
 from pathlib import Path
 from src.api_client import APIClient
-from src.response_handler import ResponseHandler
-from utils.logger import get_logger
+from src.async_api_client import AsyncAPIClient
+from src.response_handler import default_handler
+from utils import allure_helpers
+from utils.logger import add_execution_separator, get_logger
 
 
 def pytest_addoption(parser):
@@ -20,6 +25,17 @@ def pytest_addoption(parser):
         default="https://jsonplaceholder.typicode.com",
         help="Base URL for API tests"
     )
+    parser.addoption(
+        "--allure-verbose",
+        action="store_true",
+        default=False,
+        help="Write per-step Allure attachments (off by default for speed)"
+    )
+
+
+def pytest_configure(config):
+    """Apply command line options to helper modules."""
+    allure_helpers.set_verbose(config.getoption("--allure-verbose"))
 
 
 @pytest.fixture(scope="session")
@@ -39,24 +55,65 @@ def logger():
     return get_logger("APITests")
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def api_client(base_url, logger):
     """
-    Provide API client instance.
-
-    Yields client and ensures proper cleanup after test.
+    Provide API client instance shared across the whole session.
+
+    A single client means a single requests.Session, so all tests reuse
+    the same keep-alive connection pool instead of paying a fresh
+    TCP/TLS handshake per test. Under pytest-xdist each worker process
+    builds its own client, with the pool sized to the machine so
+    workers don't thrash the pool. Yields client and closes it after
+    the last test.
     """
-    client = APIClient(base_url=base_url, timeout=10, max_retries=3)
-    logger.info(f"API client created for test with base_url: {base_url}")
+    pool_size = max(20, os.cpu_count() or 1)
+    client = APIClient(
+        base_url=base_url,
+        timeout=10,
+        max_retries=3,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size
+    )
+    logger.info(f"API client created for session with base_url: {base_url}")
     yield client
     client.close()
     logger.info("API client closed")
 
 
+@pytest.fixture(scope="session")
+def fast_api_client(base_url, logger):
+    """
+    Provide a fast-fail API client with retries disabled.
+
+    Intended for negative tests, where retrying a transient server
+    error would only delay the expected failure status.
+    """
+    client = APIClient(base_url=base_url, timeout=10, max_retries=0)
+    logger.info(f"Fast-fail API client created with base_url: {base_url}")
+    yield client
+    client.close()
+    logger.info("Fast-fail API client closed")
+
+
+@pytest_asyncio.fixture(scope="function")
+async def async_api_client(base_url, logger):
+    """
+    Provide async API client instance for concurrent request tests.
+
+    Yields client and ensures proper cleanup after test.
+    """
+    client = AsyncAPIClient(base_url=base_url, timeout=10)
+    logger.info(f"Async API client created with base_url: {base_url}")
+    yield client
+    await client.aclose()
+    logger.info("Async API client closed")
+
+
 @pytest.fixture(scope="session")
 def response_handler():
-    """Provide response handler instance."""
-    return ResponseHandler()
+    """Provide the shared response handler instance."""
+    return default_handler
 
 
 @pytest.fixture(scope="session")
@@ -72,6 +129,40 @@ def post_schema():
     return schema
 
 
+@pytest.fixture(scope="session")
+def post_schema_validator(post_schema):
+    """
+    Provide a pre-compiled fastjsonschema validator for the post schema.
+
+    Compiled once per session; validation is a plain function call
+    specialized to the schema.
+    """
+    return fastjsonschema.compile(post_schema)
+
+
+@pytest.fixture(scope="session")
+def post_list_validator(post_schema):
+    """
+    Provide a pre-compiled validator for an array of posts.
+
+    Validating a whole list in one call lets the validator iterate
+    internally instead of dispatching per post from the test.
+    """
+    return fastjsonschema.compile({"type": "array", "items": post_schema})
+
+
+@pytest.fixture(scope="session")
+def all_posts(api_client):
+    """
+    Provide the parsed GET /posts payload, fetched once per session.
+
+    Built on get_cached so any test needing the full post list shares
+    one network fetch and one JSON decode. Tests asserting on the raw
+    HTTP exchange should issue their own request instead.
+    """
+    return api_client.get_cached("/posts")
+
+
 @pytest.fixture(autouse=True)
 def log_separator_after_test():
     """
@@ -86,6 +177,5 @@ def log_separator_after_test():
     # This code runs after each test completes
     
     # Add a separator line to visually distinguish between tests
-    logger = get_logger("TestSeparator")
-    logger.info(f"\n" + "=" * 80 + f"\n✅ TEST COMPLETED\n" + "=" * 80 + "\n")
+    add_execution_separator(get_logger("TestSeparator"), "✅ TEST COMPLETED")
 
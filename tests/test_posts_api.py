@@ -3,99 +3,132 @@ Test suite for JSONPlaceholder Posts API.
 
 Covers:
 - GET /posts (all posts)
-- GET /posts/{id} (single post)
+- GET /posts/{id} (single post, plus 404 negative cases)
 - GET /posts?userId={n} (filtered by user)
 - POST /posts (create post)
 - PUT /posts/{id} (update post)
 - DELETE /posts/{id} (delete post)
-- Negative test (invalid endpoint)
 """
 
 import allure
 import pytest
 
+from utils.allure_helpers import allure_test, attach
+
+# Statuses accepted for a successful DELETE
+_DELETE_OK = frozenset({200, 204})
+
 
 @allure.epic("JSONPlaceholder API")
 @allure.feature("Posts Management")
 class TestPostsAPI:
     """Test suite for Posts API endpoints."""
 
-    @allure.story("Get All Posts")
-    @allure.title("Test GET /posts - Retrieve all posts")
-    @allure.description("Validates that GET /posts returns a list of posts with valid schema")
-    @allure.severity(allure.severity_level.CRITICAL)
-    @allure.tag("API", "GET", "Posts")
+    @allure_test(
+        story="Get All Posts",
+        title="Test GET /posts - Retrieve all posts",
+        description="Validates that GET /posts returns a list of posts with valid schema",
+        severity=allure.severity_level.CRITICAL,
+        tags=("API", "GET", "Posts")
+    )
     @pytest.mark.smoke
-    def test_get_all_posts(self, api_client, response_handler, post_schema, logger):
+    def test_get_all_posts(self, api_client, response_handler, post_schema_validator, all_posts, logger):
         """
         Test GET /posts returns all posts.
 
+        This is the dedicated raw-status test for /posts; body
+        assertions run against the shared all_posts fixture so other
+        tests reuse the same fetch.
+
         Validates:
-        - Status code 200 
+        - Status code 200
         - Response is non-empty list
         - Each item matches post schema
         """
         with allure.step("Send GET request to /posts"):
             logger.info("Starting test: test_get_all_posts")
             response = api_client.get("/posts")
-            allure.attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
+            attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
 
         with allure.step("Validate status code is 200"):
             response_handler.assert_status(response, 200)
 
-        with allure.step("Parse and validate response structure"):
-            posts = response_handler.get_json(response)
+        with allure.step("Validate response structure"):
+            posts = all_posts
             response_handler.assert_non_empty_list(posts)
-            allure.attach(f"Total posts retrieved: {len(posts)}", name="Posts Count", attachment_type=allure.attachment_type.TEXT)
+            attach(f"Total posts retrieved: {len(posts)}", name="Posts Count", attachment_type=allure.attachment_type.TEXT)
 
         with allure.step("Validate schema for first 5 posts"):
-            for i, post in enumerate(posts[:5], 1):
-                response_handler.validate_schema(post, post_schema)
-            allure.attach(f"Validated {min(5, len(posts))} posts against schema", name="Schema Validation", attachment_type=allure.attachment_type.TEXT)
+            for post in posts[:5]:
+                response_handler.validate_schema_fast(post, post_schema_validator)
+            attach(f"Validated {min(5, len(posts))} posts against schema", name="Schema Validation", attachment_type=allure.attachment_type.TEXT)
 
         logger.info(f"Test passed: Retrieved {len(posts)} posts")
 
-    @allure.story("Get Single Post")
-    @allure.title("Test GET /posts/1 - Retrieve specific post")
-    @allure.description("Validates that GET /posts/1 returns post with id=1 and matches schema")
-    @allure.severity(allure.severity_level.CRITICAL)
-    @allure.tag("API", "GET", "Posts")
+    @allure_test(
+        story="Get Single Post",
+        title="Test GET {path} - Retrieve post by path",
+        description="Validates GET by path: existing post returns 200 with valid schema, bad paths return 404",
+        severity=allure.severity_level.CRITICAL,
+        tags=("API", "GET", "Posts", "404")
+    )
     @pytest.mark.smoke
-    def test_get_single_post(self, api_client, response_handler, post_schema, logger):
+    @pytest.mark.parametrize(
+        "path,expected_status",
+        [
+            ("/posts/1", 200),
+            ("/posts/99999", 404),
+            ("/postz", 404),
+        ],
+        ids=["existing-post", "non-existent-id", "invalid-endpoint"]
+    )
+    def test_get_post_by_path(
+        self, api_client, fast_api_client, response_handler,
+        post_schema_validator, path, expected_status, logger
+    ):
         """
-        Test GET /posts/1 returns specific post.
+        Test GET by path for existing and invalid resources.
+
+        Folds the single-post test and the two 404 negative tests into
+        one parametrization, so pytest resolves fixtures and the Allure
+        lifecycle once per case instead of per hand-written test.
+        Negative cases use the fast-fail client (no retries).
 
         Validates:
-        - Status code 200
-        - Post id is 1
-        - Response matches post schema
+        - Expected status code per path
+        - For the existing post: id is 1 and response matches schema
         """
-        with allure.step("Send GET request to /posts/1"):
-            logger.info("Starting test: test_get_single_post")
-            response = api_client.get("/posts/1")
-            allure.attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
-
-        with allure.step("Validate status code is 200"):
-            response_handler.assert_status(response, 200)
-
-        with allure.step("Parse response and validate post ID"):
-            post = response_handler.get_json(response)
-            response_handler.assert_field_value(post, "id", 1)
-            allure.attach(f"Post Title: {post['title']}", name="Post Details", attachment_type=allure.attachment_type.TEXT)
-
-        with allure.step("Validate response against post schema"):
-            response_handler.validate_schema(post, post_schema)
-
-        logger.info(f"Test passed: Retrieved post with id=1, title='{post['title']}'")
-
-    @allure.story("Filter Posts")
-    @allure.title("Test GET /posts?userId={user_id} - Filter posts by user")
-    @allure.description("Validates that GET /posts with userId parameter filters posts correctly")
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.tag("API", "GET", "Posts", "Filter")
+        client = api_client if expected_status == 200 else fast_api_client
+
+        with allure.step(f"Send GET request to {path}"):
+            logger.info(f"Starting test: test_get_post_by_path for {path}")
+            response = client.get(path)
+            attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step(f"Validate status code is {expected_status}"):
+            response_handler.assert_status(response, expected_status)
+
+        if expected_status == 200:
+            with allure.step("Parse response and validate post ID"):
+                post = response_handler.get_json(response)
+                response_handler.assert_field_value(post, "id", 1)
+                attach(f"Post Title: {post['title']}", name="Post Details", attachment_type=allure.attachment_type.TEXT)
+
+            with allure.step("Validate response against post schema"):
+                response_handler.validate_schema_fast(post, post_schema_validator)
+
+        logger.info(f"Test passed: GET {path} returned {expected_status}")
+
+    @allure_test(
+        story="Filter Posts",
+        title="Test GET /posts?userId={user_id} - Filter posts by user",
+        description="Validates that GET /posts with userId parameter filters posts correctly",
+        severity=allure.severity_level.NORMAL,
+        tags=("API", "GET", "Posts", "Filter")
+    )
     @pytest.mark.regression
     @pytest.mark.parametrize("user_id", [1, 2])
-    def test_get_posts_by_user(self, api_client, response_handler, post_schema, user_id, logger):
+    def test_get_posts_by_user(self, api_client, response_handler, post_list_validator, user_id, logger):
         """
         Test GET /posts?userId={n} filters posts by user.
 
@@ -107,7 +140,7 @@ class TestPostsAPI:
         with allure.step(f"Send GET request to /posts with userId={user_id}"):
             logger.info(f"Starting test: test_get_posts_by_user with userId={user_id}")
             response = api_client.get("/posts", params={"userId": user_id})
-            allure.attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
+            attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
 
         with allure.step("Validate status code is 200"):
             response_handler.assert_status(response, 200)
@@ -115,20 +148,67 @@ class TestPostsAPI:
         with allure.step("Parse response and validate it's a non-empty list"):
             posts = response_handler.get_json(response)
             response_handler.assert_non_empty_list(posts)
-            allure.attach(f"Total posts for userId={user_id}: {len(posts)}", name="Filtered Posts Count", attachment_type=allure.attachment_type.TEXT)
+            attach(f"Total posts for userId={user_id}: {len(posts)}", name="Filtered Posts Count", attachment_type=allure.attachment_type.TEXT)
 
         with allure.step(f"Verify all posts belong to userId={user_id} and match schema"):
-            for post in posts:
-                response_handler.assert_field_value(post, "userId", user_id)
-                response_handler.validate_schema(post, post_schema)
+            response_handler.validate_schema_fast(posts, post_list_validator)
+            owner_ids = {post["userId"] for post in posts}
+            assert owner_ids == {user_id}, (
+                f"Expected all posts to belong to userId={user_id}, "
+                f"but found userIds: {sorted(owner_ids)}"
+            )
 
         logger.info(f"Test passed: Retrieved {len(posts)} posts for userId={user_id}")
 
-    @allure.story("Create Post")
-    @allure.title("Test POST /posts - Create new post")
-    @allure.description("Validates that POST /posts creates a new post and returns correct data")
-    @allure.severity(allure.severity_level.CRITICAL)
-    @allure.tag("API", "POST", "Posts", "Create")
+    @allure_test(
+        story="Filter Posts",
+        title="Test concurrent GET /posts?userId={n} - Fetch multiple users in parallel",
+        description="Validates filtered posts for several users fetched concurrently via get_many",
+        severity=allure.severity_level.NORMAL,
+        tags=("API", "GET", "Posts", "Async")
+    )
+    @pytest.mark.regression
+    @pytest.mark.asyncio
+    async def test_get_posts_by_users_concurrently(self, async_api_client, response_handler, logger):
+        """
+        Test concurrent GET /posts?userId={n} for several users.
+
+        Validates:
+        - All requests succeed with status 200
+        - get_many returns responses in request order: each response
+          only contains posts for the user at the same position
+
+        The requests fan out through get_many over the shared pool, so
+        total wall time is one round-trip instead of one per user.
+        """
+        user_ids = [1, 2, 3]
+
+        with allure.step(f"Fan out concurrent GET requests for userIds={user_ids}"):
+            logger.info("Starting test: test_get_posts_by_users_concurrently")
+            responses = await async_api_client.get_many(
+                [f"/posts?userId={uid}" for uid in user_ids]
+            )
+
+        with allure.step("Validate each response status and ownership"):
+            for user_id, response in zip(user_ids, responses):
+                response_handler.assert_status(response, 200)
+                posts = response.json()
+                response_handler.assert_non_empty_list(posts)
+                owner_ids = {post["userId"] for post in posts}
+                assert owner_ids == {user_id}, (
+                    f"Expected all posts to belong to userId={user_id}, "
+                    f"but found userIds: {sorted(owner_ids)}"
+                )
+
+        logger.info(f"Test passed: Concurrently fetched posts for {len(user_ids)} users")
+
+    @allure_test(
+        story="Create Post",
+        title="Test POST /posts - Create new post",
+        description="Validates that POST /posts creates a new post and returns correct data",
+        severity=allure.severity_level.CRITICAL,
+        tags=("API", "POST", "Posts", "Create")
+    )
     @pytest.mark.smoke
     def test_create_post(self, api_client, response_handler, logger):
         """
@@ -146,11 +226,11 @@ class TestPostsAPI:
                 "body": "This is a test post body",
                 "userId": 1
             }
-            allure.attach(str(payload), name="Request Payload", attachment_type=allure.attachment_type.JSON)
+            attach(str(payload), name="Request Payload", attachment_type=allure.attachment_type.JSON)
 
         with allure.step("Send POST request to /posts"):
-            response = api_client.post("/posts", json=payload)
-            allure.attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
+            response = api_client.post_json("/posts", payload)
+            attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
 
         with allure.step("Validate status code is 201 (Created)"):
             response_handler.assert_status(response, 201)
@@ -158,18 +238,18 @@ class TestPostsAPI:
         with allure.step("Validate response contains correct data"):
             created_post = response_handler.get_json(response)
             response_handler.assert_field_exists(created_post, "id")
-            response_handler.assert_field_value(created_post, "title", payload["title"])
-            response_handler.assert_field_value(created_post, "body", payload["body"])
-            response_handler.assert_field_value(created_post, "userId", payload["userId"])
-            allure.attach(f"Created Post ID: {created_post['id']}", name="Created Post", attachment_type=allure.attachment_type.TEXT)
+            response_handler.assert_fields_match(created_post, payload)
+            attach(f"Created Post ID: {created_post['id']}", name="Created Post", attachment_type=allure.attachment_type.TEXT)
 
         logger.info(f"Test passed: Created post with id={created_post['id']}")
 
-    @allure.story("Update Post")
-    @allure.title("Test PUT /posts/1 - Update existing post")
-    @allure.description("Validates that PUT /posts/1 updates post and returns updated data")
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.tag("API", "PUT", "Posts", "Update")
+    @allure_test(
+        story="Update Post",
+        title="Test PUT /posts/1 - Update existing post",
+        description="Validates that PUT /posts/1 updates post and returns updated data",
+        severity=allure.severity_level.NORMAL,
+        tags=("API", "PUT", "Posts", "Update")
+    )
     @pytest.mark.regression
     def test_update_post(self, api_client, response_handler, logger):
         """
@@ -187,29 +267,28 @@ class TestPostsAPI:
                 "body": "Updated body content",
                 "userId": 1
             }
-            allure.attach(str(payload), name="Update Payload", attachment_type=allure.attachment_type.JSON)
+            attach(str(payload), name="Update Payload", attachment_type=allure.attachment_type.JSON)
 
         with allure.step("Send PUT request to /posts/1"):
-            response = api_client.put("/posts/1", json=payload)
-            allure.attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
+            response = api_client.put_json("/posts/1", payload)
+            attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
 
         with allure.step("Validate status code is 200"):
             response_handler.assert_status(response, 200)
 
         with allure.step("Validate response contains updated data"):
             updated_post = response_handler.get_json(response)
-            response_handler.assert_field_value(updated_post, "id", payload["id"])
-            response_handler.assert_field_value(updated_post, "title", payload["title"])
-            response_handler.assert_field_value(updated_post, "body", payload["body"])
-            response_handler.assert_field_value(updated_post, "userId", payload["userId"])
+            response_handler.assert_fields_match(updated_post, payload)
 
         logger.info(f"Test passed: Updated post with id=1")
 
-    @allure.story("Delete Post")
-    @allure.title("Test DELETE /posts/1 - Delete post")
-    @allure.description("Validates that DELETE /posts/1 successfully deletes a post")
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.tag("API", "DELETE", "Posts")
+    @allure_test(
+        story="Delete Post",
+        title="Test DELETE /posts/1 - Delete post",
+        description="Validates that DELETE /posts/1 successfully deletes a post",
+        severity=allure.severity_level.NORMAL,
+        tags=("API", "DELETE", "Posts")
+    )
     @pytest.mark.regression
     def test_delete_post(self, api_client, response_handler, logger):
         """
@@ -221,92 +300,56 @@ class TestPostsAPI:
         with allure.step("Send DELETE request to /posts/1"):
             logger.info("Starting test: test_delete_post")
             response = api_client.delete("/posts/1")
-            allure.attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
+            attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
 
         with allure.step("Validate status code is 200 or 204"):
-            assert response.status_code in [200, 204], (
-                f"Expected status 200 or 204, but got {response.status_code}"
+            status_code = response.status_code
+            assert status_code in _DELETE_OK, (
+                f"Expected status 200 or 204, but got {status_code}"
             )
 
-        logger.info(f"Test passed: Deleted post with status={response.status_code}")
+        logger.info(f"Test passed: Deleted post with status={status_code}")
 
-    @allure.story("Error Handling")
-    @allure.title("Test GET /postz - Invalid endpoint returns 404")
-    @allure.description("Negative test: Validates that invalid endpoint returns 404 status")
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.tag("API", "GET", "Negative", "404")
-    @pytest.mark.smoke
-    def test_invalid_endpoint_returns_404(self, api_client, response_handler, logger):
-        """
-        Negative test: Invalid endpoint returns 404.
-
-        Validates:
-        - Status code 404 for non-existent endpoint
-        """
-        with allure.step("Send GET request to invalid endpoint /postz"):
-            logger.info("Starting test: test_invalid_endpoint_returns_404")
-            response = api_client.get("/postz")
-            allure.attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
-
-        with allure.step("Validate status code is 404"):
-            response_handler.assert_status(response, 404)
-
-        logger.info("Test passed: Invalid endpoint correctly returned 404")
-
-    @allure.story("Error Handling")
-    @allure.title("Test GET /posts/99999 - Non-existent post returns 404")
-    @allure.description("Negative test: Validates that non-existent post ID returns 404 status")
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.tag("API", "GET", "Negative", "404")
-    @pytest.mark.regression
-    def test_get_non_existent_post_returns_404(self, api_client, response_handler, logger):
-        """
-        Negative test: Non-existent post ID returns 404.
-
-        Validates:
-        - Status code 404 for invalid post ID
-        """
-        with allure.step("Send GET request to /posts/99999 (non-existent ID)"):
-            logger.info("Starting test: test_get_non_existent_post_returns_404")
-            response = api_client.get("/posts/99999")
-            allure.attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
-
-        with allure.step("Validate status code is 404"):
-            response_handler.assert_status(response, 404)
-
-        logger.info("Test passed: Non-existent post correctly returned 404")
-
-    @allure.story("Response Validation")
-    @allure.title("Test GET /posts - Validate response structure")
-    @allure.description("Validates response structure, field types, and data integrity")
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.tag("API", "GET", "Validation")
+    @allure_test(
+        story="Response Validation",
+        title="Test GET /posts - Validate response structure",
+        description="Validates response structure, field types, and data integrity",
+        severity=allure.severity_level.NORMAL,
+        tags=("API", "GET", "Validation")
+    )
     @pytest.mark.regression
-    def test_get_posts_response_structure(self, api_client, response_handler, logger):
+    def test_get_posts_response_structure(self, api_client, response_handler, post_schema_validator, logger):
         """
         Test GET /posts response has correct structure.
 
+        Streams the response through ijson instead of materializing all
+        100 posts: each post is schema-validated as it arrives (so
+        validation CPU overlaps the network receive) and only the first
+        is kept as a Python dict for field/type checks. Status-code
+        coverage for this endpoint lives in test_get_all_posts.
+
         Validates:
-        - Response is a list
-        - List contains at least 100 posts
-        - Each post has required fields
+        - Response is a list with at least 100 posts
+        - Every post matches the schema
+        - First post has required fields with correct types
         """
-        with allure.step("Send GET request to /posts"):
+        with allure.step("Stream GET /posts, validating posts as they arrive"):
             logger.info("Starting test: test_get_posts_response_structure")
-            response = api_client.get("/posts")
-            allure.attach(f"Status Code: {response.status_code}", name="Response Status", attachment_type=allure.attachment_type.TEXT)
-
-        with allure.step("Validate status code is 200"):
-            response_handler.assert_status(response, 200)
-
-        with allure.step("Parse response and validate list structure"):
-            posts = response_handler.get_json(response)
-            response_handler.assert_non_empty_list(posts)
-            assert len(posts) >= 100, f"Expected at least 100 posts, but got {len(posts)}"
-            allure.attach(f"Total posts: {len(posts)}", name="Posts Count", attachment_type=allure.attachment_type.TEXT)
+            response = api_client.get("/posts", stream=True)
+            items = response_handler.iter_json_array(response)
+            first_post = next(items, None)
+            assert first_post is not None, "Expected non-empty list of posts"
+            post_schema_validator(first_post)
+            total_posts = 1
+            for post in items:
+                post_schema_validator(post)
+                total_posts += 1
+
+        with allure.step("Validate list length"):
+            assert total_posts >= 100, f"Expected at least 100 posts, but got {total_posts}"
+            attach(f"Total posts: {total_posts}", name="Posts Count", attachment_type=allure.attachment_type.TEXT)
 
         with allure.step("Validate first post has all required fields"):
-            first_post = posts[0]
             response_handler.assert_field_exists(first_post, "userId")
             response_handler.assert_field_exists(first_post, "id")
             response_handler.assert_field_exists(first_post, "title")
@@ -318,5 +361,5 @@ class TestPostsAPI:
             response_handler.assert_field_type(first_post, "title", str)
             response_handler.assert_field_type(first_post, "body", str)
 
-        logger.info(f"Test passed: Response structure validated for {len(posts)} posts")
+        logger.info(f"Test passed: Response structure validated for {total_posts} posts")
 
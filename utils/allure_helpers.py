@@ -0,0 +1,77 @@
+"""
+Allure helper utilities.
+
+Wraps allure.attach so attachment writes can be switched off for fast
+CI runs: every attachment is a file write into the results directory,
+which adds up across tests. Attachments are disabled by default and
+enabled with the --allure-verbose pytest option.
+"""
+
+import allure
+
+# Toggled from conftest.py based on the --allure-verbose option
+_verbose: bool = False
+
+
+def set_verbose(enabled: bool) -> None:
+    """
+    Enable or disable attachment writes.
+
+    Args:
+        enabled: True to write attachments to the Allure results dir
+    """
+    global _verbose
+    _verbose = enabled
+
+
+def allure_test(
+                    story: str,
+                    title: str,
+                    description: str = None,
+                    severity=allure.severity_level.NORMAL,
+                    tags: tuple = ()
+                ):
+    """
+    Combine the standard per-test Allure decorators into one.
+
+    Every test method previously stacked five @allure.* decorators;
+    this factory applies story, title, description, severity, and tags
+    in a single pass, so each test builds one wrapper chain at import
+    instead of five.
+
+    Args:
+        story: Allure story name
+        title: Allure test title
+        description: Optional longer description
+        severity: Allure severity level
+        tags: Tags to attach to the test
+
+    Returns:
+        Decorator applying the combined Allure metadata
+    """
+    def decorator(fn):
+        fn = allure.story(story)(fn)
+        fn = allure.title(title)(fn)
+        if description is not None:
+            fn = allure.description(description)(fn)
+        fn = allure.severity(severity)(fn)
+        if tags:
+            fn = allure.tag(*tags)(fn)
+        return fn
+    return decorator
+
+
+def attach(value, name: str, attachment_type=allure.attachment_type.TEXT) -> None:
+    """
+    Attach a value to the Allure report when verbose attachments are on.
+
+    No-op unless the run was started with --allure-verbose, so the
+    default CI path skips the per-attachment file write.
+
+    Args:
+        value: Attachment body
+        name: Attachment name shown in the report
+        attachment_type: Allure attachment type
+    """
+    if _verbose:
+        allure.attach(value, name=name, attachment_type=attachment_type)
@@ -24,6 +24,15 @@ from loguru import logger
 _initialized: bool = False
 _log_file_path: Optional[str] = None
 
+# Resolved once at import; avoids rebuilding Path objects on (re)init,
+# e.g. when xdist workers each initialize their own logger
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_LOGS_DIR = _PROJECT_ROOT / "Logs"
+
+# Prebuilt separator template so each boundary log is one format call
+_SEP = "=" * 80
+_SEP_TEMPLATE = "\n" + _SEP + "\n{}\n" + _SEP + "\n"
+
 
 def _get_log_file_path() -> str:
     """
@@ -32,15 +41,17 @@ def _get_log_file_path() -> str:
     Returns:
         Full path to the log file
     """
-    # Create Logs directory structure
-    project_root = Path(__file__).parent.parent
-    logs_dir = project_root / "Logs"
-    date_folder = logs_dir / datetime.now().strftime("%Y-%m-%d")
-    date_folder.mkdir(parents=True, exist_ok=True)
+    # One timestamp for both the date folder and the file name
+    now = datetime.now()
+
+    # Create Logs directory structure, skipping the mkdir syscalls when
+    # the date folder already exists (e.g. other xdist workers made it)
+    date_folder = _LOGS_DIR / now.strftime("%Y-%m-%d")
+    if not os.path.isdir(date_folder):
+        date_folder.mkdir(parents=True, exist_ok=True)
 
     # Create timestamped log file
-    timestamp = datetime.now().strftime("%H%M%S")
-    log_file = date_folder / f"run_{timestamp}.log"
+    log_file = date_folder / f"run_{now.strftime('%H%M%S')}.log"
 
     return str(log_file)
 
@@ -58,14 +69,17 @@ def _initialize_logger():
     # Remove default handler
     logger.remove()
 
-    # Add console handler
+    # Add console handler writing straight to stderr; a stream sink
+    # avoids the per-message lambda + print indirection
     logger.add(
-        sink=lambda msg: print(msg, end=""),
+        sink=sys.stderr,
         format="<green>{time:YYYY-MM-DD HH:mm:ss,SSS}</green> - {name} - <level>{level}</level> - {message}",
         level="INFO",
     )
 
-    # Add file handler with format matching your desired style
+    # Add file handler with format matching your desired style.
+    # enqueue=True moves formatting and disk writes to a background
+    # thread so test code never blocks on file I/O.
     logger.add(
         sink=_log_file_path,
         format="{time:YYYY-MM-DD HH:mm:ss,SSS} - {name} - {level} - {message}",
@@ -73,6 +87,9 @@ def _initialize_logger():
         rotation=None,  # No rotation (one file per run)
         retention=None,  # Keep all files
         encoding="utf-8",
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
     logger.info(f"Logger initialized. Log file: {_log_file_path}")
@@ -115,5 +132,4 @@ def add_execution_separator(log, title: str = "NEW TEST EXECUTION"):
         log: Logger instance
         title: Title for the separator
     """
-    separator = "=" * 80
-    log.info(f"\n{separator}\n{title}\n{separator}\n")
+    log.info(_SEP_TEMPLATE.format(title))